@@ -53,6 +53,12 @@ class DirectGeminiExtractor:
     
     async def _extract_text_simple(self, file_path: str) -> str:
         """Extract text using simple, reliable methods"""
+        # pdfplumber and PyMuPDF are synchronous; keep them off the event loop
+        return await asyncio.to_thread(self._extract_text_sync, file_path)
+    
+    @staticmethod
+    def _extract_text_sync(file_path: str) -> str:
+        """Blocking text extraction, run in a worker thread"""
         text_content = ""
         
         # Try pdfplumber first (most reliable)
@@ -10,6 +10,7 @@ from fastapi import FastAPI, File, HTTPException, Query, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from .models import Contract, ContractData, ContractStatus
 from .parser import ContractParser
@@ -34,6 +35,15 @@ app.add_middleware(
 contract_parser = ContractParser()
 scoring_engine = ScoringEngine()
 
+# Upload limits
+MAX_UPLOAD_SIZE = 50 * 1024 * 1024  # 50MB
+
+# Field projections for reads that never touch parsed_data / extracted text
+STATUS_PROJECTION = {"_id": 0, "status": 1, "progress": 1, "error": 1, "updated_at": 1}
+LIST_PROJECTION = {"_id": 0, "id": 1, "filename": 1, "status": 1, "uploaded_at": 1,
+                   "file_size": 1, "score": 1, "progress": 1}
+FILE_PROJECTION = {"_id": 0, "filename": 1, "file_path": 1}
+
 @app.on_event("startup")
 async def startup_db_client():
     """Initialize database connection on startup"""
@@ -61,11 +71,14 @@ async def startup_db_client():
     
     # Create indexes
     try:
-        await app.mongodb.contracts.create_index("id", unique=True)
-        await app.mongodb.contracts.create_index("status")
-        await app.mongodb.contracts.create_index("uploaded_at")
-        await app.mongodb.contracts.create_index("score")
-        await app.mongodb.contracts.create_index([("status", 1), ("uploaded_at", -1)])
+        # Submit all indexes in a single createIndexes command
+        await app.mongodb.contracts.create_indexes([
+            IndexModel([("id", ASCENDING)], unique=True),
+            IndexModel([("status", ASCENDING)]),
+            IndexModel([("uploaded_at", ASCENDING)]),
+            IndexModel([("score", ASCENDING)]),
+            IndexModel([("status", ASCENDING), ("uploaded_at", DESCENDING)]),
+        ])
         logger.info("Database indexes created successfully")
     except Exception as e:
         logger.error(f"Error creating database indexes: {str(e)}")
@@ -87,9 +100,9 @@ async def upload_contract(file: UploadFile = File(...)):
         # Read content for validation
         content = await file.read()
         
-        # Validate file size (50MB limit)
-        if len(content) > 50 * 1024 * 1024:  # 50MB
-            raise HTTPException(status_code=400, detail="File size exceeds 50MB limit")
+        # Validate file size
+        if len(content) > MAX_UPLOAD_SIZE:
+            raise HTTPException(status_code=413, detail="File size exceeds 50MB limit")
         
         # Validate PDF header
         if not content.startswith(b'%PDF'):
@@ -124,13 +137,15 @@ async def upload_contract(file: UploadFile = File(...)):
             file_size=len(content)
         )
         
-        await app.mongodb.contracts.insert_one(contract.dict())
+        await app.mongodb.contracts.insert_one(contract.model_dump())
         
         # Start background processing
         asyncio.create_task(process_contract(contract_id))
         
         return {"contract_id": contract_id, "status": "uploaded", "message": "Contract uploaded successfully"}
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error uploading contract: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error uploading contract: {str(e)}")
@@ -139,7 +154,7 @@ async def upload_contract(file: UploadFile = File(...)):
 async def get_contract_status(contract_id: str):
     """Get the processing status of a contract"""
     try:
-        contract = await app.mongodb.contracts.find_one({"id": contract_id})
+        contract = await app.mongodb.contracts.find_one({"id": contract_id}, STATUS_PROJECTION)
         if not contract:
             raise HTTPException(status_code=404, detail="Contract not found")
         
@@ -195,12 +210,12 @@ async def list_contracts(
         sort_direction = -1 if sort_order == "desc" else 1
         sort_dict = {sort_by: sort_direction}
         
-        # Get contracts
-        cursor = app.mongodb.contracts.find(filter_dict).sort(sort_dict).skip(skip).limit(limit)
-        contracts = await cursor.to_list(length=limit)
-        
-        # Get total count
-        total = await app.mongodb.contracts.count_documents(filter_dict)
+        # Fetch the page and the total count concurrently
+        cursor = app.mongodb.contracts.find(filter_dict, LIST_PROJECTION).sort(sort_dict).skip(skip).limit(limit)
+        contracts, total = await asyncio.gather(
+            cursor.to_list(length=limit),
+            app.mongodb.contracts.count_documents(filter_dict)
+        )
         
         # Format response
         contract_list = []
@@ -230,7 +245,7 @@ async def list_contracts(
 async def download_contract(contract_id: str):
     """Download the original contract file"""
     try:
-        contract = await app.mongodb.contracts.find_one({"id": contract_id})
+        contract = await app.mongodb.contracts.find_one({"id": contract_id}, FILE_PROJECTION)
         if not contract:
             raise HTTPException(status_code=404, detail="Contract not found")
         
@@ -254,8 +269,8 @@ async def download_contract(contract_id: str):
 async def delete_contract(contract_id: str):
     """Delete a contract and its associated files"""
     try:
-        # Get contract from database
-        contract = await app.mongodb.contracts.find_one({"id": contract_id})
+        # Remove the record and fetch it in the same round trip
+        contract = await app.mongodb.contracts.find_one_and_delete({"id": contract_id}, projection=FILE_PROJECTION)
         
         if not contract:
             raise HTTPException(status_code=404, detail="Contract not found")
@@ -269,12 +284,6 @@ async def delete_contract(contract_id: str):
             except Exception as e:
                 logger.warning(f"Could not delete contract file {file_path}: {str(e)}")
         
-        # Delete from MongoDB Atlas
-        result = await app.mongodb.contracts.delete_one({"id": contract_id})
-        
-        if result.deleted_count == 0:
-            raise HTTPException(status_code=404, detail="Contract not found in database")
-        
         logger.info(f"Successfully deleted contract {contract_id} from database")
         
         return {
@@ -324,8 +333,8 @@ async def process_contract(contract_id: str):
             {"$set": {"progress": 80, "updated_at": datetime.utcnow()}}
         )
         
-        # Convert ContractData to dict for scoring
-        parsed_data_dict = parsed_data.dict() if hasattr(parsed_data, 'dict') else parsed_data
+        # Convert ContractData to dict once for both scoring and storage
+        parsed_data_dict = parsed_data.model_dump() if hasattr(parsed_data, 'model_dump') else parsed_data
         logger.info(f"Scoring data: {type(parsed_data)}")
         score, gaps = scoring_engine.calculate_score(parsed_data_dict)
         logger.info(f"Calculated score: {score}, Gaps: {len(gaps)}")
@@ -337,7 +346,7 @@ async def process_contract(contract_id: str):
                 "$set": {
                     "status": ContractStatus.COMPLETED,
                     "progress": 100,
-                    "parsed_data": parsed_data.dict() if hasattr(parsed_data, 'dict') else parsed_data,
+                    "parsed_data": parsed_data_dict,
                     "score": score,
                     "gaps": gaps,
                     "updated_at": datetime.utcnow()
@@ -23,22 +23,46 @@ class ScoringEngine:
             "revenue_classification": ["payment_type", "billing_cycle"],
             "service_level_agreements": ["performance_metrics", "support_terms"]
         }
+        
+        # Points per populated party field, capped at 80 per party
+        self.party_field_points = [
+            ("name", 20),
+            ("role", 15),
+            ("legal_entity", 15),
+            ("email", 10),
+            ("phone", 10),
+            ("address", 10),
+            ("registration_number", 10)
+        ]
+        
+        # Gap checks per section: (section key, message when missing, [(field, message when empty)])
+        self.section_gap_checks = [
+            ("financial_details", "No financial details found", [
+                ("total_contract_value", "Missing total contract value"),
+                ("line_items", "No line items found")
+            ]),
+            ("payment_terms", "No payment terms found", [
+                ("payment_terms", "Missing payment terms (Net 30, Net 60, etc.)")
+            ]),
+            ("account_info", "No account information found", [
+                ("contact_email", "Missing contact email")
+            ]),
+            ("revenue_classification", "No revenue classification found", [
+                ("payment_type", "Missing payment type (recurring/one-time)")
+            ]),
+            ("sla", "No SLA information found", [
+                ("performance_metrics", "No performance metrics defined"),
+                ("support_terms", "No support terms defined")
+            ])
+        ]
 
     def calculate_score(self, parsed_data: Dict[str, Any]) -> tuple[float, List[str]]:
         """Calculate overall contract score and identify gaps"""
         try:
-            scores = {}
-            gaps = []
-            
-            # Calculate individual component scores
-            scores["financial_completeness"] = self._calculate_financial_score(parsed_data)
-            scores["party_identification"] = self._calculate_party_score(parsed_data)
-            scores["payment_terms_clarity"] = self._calculate_payment_score(parsed_data)
-            scores["sla_definition"] = self._calculate_sla_score(parsed_data)
-            scores["contact_information"] = self._calculate_contact_score(parsed_data)
+            scores = self._calculate_component_scores(parsed_data)
             
             # Calculate weighted overall score
-            overall_score = sum(scores[component] * self.weights[component] / 100 for component in scores)
+            overall_score = self._weighted_score(scores)
             
             # Identify gaps
             gaps = self._identify_gaps(parsed_data)
@@ -51,6 +75,20 @@ class ScoringEngine:
             logger.error(f"Error calculating contract score: {str(e)}")
             return 0.0, [f"Scoring error: {str(e)}"]
 
+    def _calculate_component_scores(self, parsed_data: Dict[str, Any]) -> Dict[str, float]:
+        """Calculate each weighted component score once (0-100 each)"""
+        return {
+            "financial_completeness": self._calculate_financial_score(parsed_data),
+            "party_identification": self._calculate_party_score(parsed_data),
+            "payment_terms_clarity": self._calculate_payment_score(parsed_data),
+            "sla_definition": self._calculate_sla_score(parsed_data),
+            "contact_information": self._calculate_contact_score(parsed_data)
+        }
+
+    def _weighted_score(self, scores: Dict[str, float]) -> float:
+        """Combine component scores using the configured weights"""
+        return sum(scores[component] * self.weights[component] / 100 for component in scores)
+
     def _calculate_financial_score(self, parsed_data: Dict[str, Any]) -> float:
         """Calculate financial completeness score (0-100)"""
         score = 0
@@ -63,15 +101,15 @@ class ScoringEngine:
         if financial_details.get("total_contract_value"):
             score += 40
         
-        # Line items (30 points)
+        # Line items (20 points, up to 30 with detail bonuses)
         line_items = financial_details.get("line_items", [])
         if line_items:
-            score += 30
+            line_item_score = 20
             # Bonus for detailed line items
             for item in line_items:
                 if item.get("description") and item.get("unit_price"):
-                    score += 2
-            score = min(score, 30)  # Cap at 30
+                    line_item_score += 2
+            score += min(line_item_score, 30)  # Cap at 30
         
         # Currency (10 points)
         if financial_details.get("currency"):
@@ -99,35 +137,8 @@ class ScoringEngine:
         score += 20
         
         # Score per party (up to 3 parties)
-        for i, party in enumerate(parties[:3]):
-            party_score = 0
-            
-            # Name (required - 20 points)
-            if party.get("name"):
-                party_score += 20
-            
-            # Role (15 points)
-            if party.get("role"):
-                party_score += 15
-            
-            # Legal entity (15 points)
-            if party.get("legal_entity"):
-                party_score += 15
-            
-            # Contact information (10 points each)
-            if party.get("email"):
-                party_score += 10
-            if party.get("phone"):
-                party_score += 10
-            
-            # Address (10 points)
-            if party.get("address"):
-                party_score += 10
-            
-            # Registration details (10 points)
-            if party.get("registration_number"):
-                party_score += 10
-            
+        for party in parties[:3]:
+            party_score = sum(points for field, points in self.party_field_points if party.get(field))
             score += min(party_score, 80)  # Cap per party
         
         return min(score, 100)
@@ -234,49 +245,13 @@ class ScoringEngine:
                 if not party.get("role"):
                     gaps.append(f"Party {i+1}: Missing role")
         
-        # Check financial details
-        financial_details = parsed_data.get("financial_details")
-        if not financial_details:
-            gaps.append("No financial details found")
-        else:
-            if not financial_details.get("total_contract_value"):
-                gaps.append("Missing total contract value")
-            if not financial_details.get("line_items"):
-                gaps.append("No line items found")
-        
-        # Check payment terms
-        payment_terms = parsed_data.get("payment_terms")
-        if not payment_terms:
-            gaps.append("No payment terms found")
-        else:
-            if not payment_terms.get("payment_terms"):
-                gaps.append("Missing payment terms (Net 30, Net 60, etc.)")
-        
-        # Check account info
-        account_info = parsed_data.get("account_info")
-        if not account_info:
-            gaps.append("No account information found")
-        else:
-            if not account_info.get("contact_email"):
-                gaps.append("Missing contact email")
-        
-        # Check revenue classification
-        revenue_classification = parsed_data.get("revenue_classification")
-        if not revenue_classification:
-            gaps.append("No revenue classification found")
-        else:
-            if not revenue_classification.get("payment_type"):
-                gaps.append("Missing payment type (recurring/one-time)")
-        
-        # Check SLA
-        sla = parsed_data.get("sla")
-        if not sla:
-            gaps.append("No SLA information found")
-        else:
-            if not sla.get("performance_metrics"):
-                gaps.append("No performance metrics defined")
-            if not sla.get("support_terms"):
-                gaps.append("No support terms defined")
+        # Check each section, then its key fields
+        for section, missing_message, field_checks in self.section_gap_checks:
+            section_data = parsed_data.get(section)
+            if not section_data:
+                gaps.append(missing_message)
+            else:
+                gaps.extend(message for field, message in field_checks if not section_data.get(field))
         
         # Check contract dates
         if not parsed_data.get("contract_start_date"):
@@ -288,45 +263,19 @@ class ScoringEngine:
 
     def get_score_breakdown(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
         """Get detailed score breakdown for analysis"""
-        scores = {}
-        gaps = []
-        
-        # Calculate individual component scores
-        scores["financial_completeness"] = {
-            "score": self._calculate_financial_score(parsed_data),
-            "weight": self.weights["financial_completeness"],
-            "max_points": 100
-        }
-        
-        scores["party_identification"] = {
-            "score": self._calculate_party_score(parsed_data),
-            "weight": self.weights["party_identification"],
-            "max_points": 100
-        }
-        
-        scores["payment_terms_clarity"] = {
-            "score": self._calculate_payment_score(parsed_data),
-            "weight": self.weights["payment_terms_clarity"],
-            "max_points": 100
-        }
-        
-        scores["sla_definition"] = {
-            "score": self._calculate_sla_score(parsed_data),
-            "weight": self.weights["sla_definition"],
-            "max_points": 100
-        }
-        
-        scores["contact_information"] = {
-            "score": self._calculate_contact_score(parsed_data),
-            "weight": self.weights["contact_information"],
-            "max_points": 100
+        component_scores = self._calculate_component_scores(parsed_data)
+        
+        scores = {
+            component: {
+                "score": score,
+                "weight": self.weights[component],
+                "max_points": 100
+            }
+            for component, score in component_scores.items()
         }
         
         # Calculate weighted overall score
-        overall_score = sum(
-            scores[component]["score"] * scores[component]["weight"] / 100 
-            for component in scores
-        )
+        overall_score = self._weighted_score(component_scores)
         
         # Identify gaps
         gaps = self._identify_gaps(parsed_data)
@@ -18,12 +18,16 @@ import {
   Trash2,
   XCircle,
 } from "lucide-react";
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import toast from "react-hot-toast";
 
 const API_BASE_URL =
   process.env.NEXT_PUBLIC_API_BASE_URL || "http://localhost:8000";
 
+// Status polling backs off from 0.5s, doubling up to 10s while contracts process
+const INITIAL_POLL_DELAY_MS = 500;
+const MAX_POLL_DELAY_MS = 10000;
+
 interface Contract {
   id: string;
   filename: string;
@@ -55,6 +59,7 @@ export default function ContractList({
   const [statusFilter, setStatusFilter] = useState("all");
   const [sortBy, setSortBy] = useState("uploaded_at");
   const [sortOrder, setSortOrder] = useState<"asc" | "desc">("desc");
+  const pollDelayRef = useRef(INITIAL_POLL_DELAY_MS);
 
   useEffect(() => {
     // Check for processing contracts and poll their status
@@ -64,12 +69,17 @@ export default function ContractList({
 
     if (processingIds.length > 0) {
       setProcessingContracts(new Set(processingIds));
-      const interval = setInterval(() => {
+      const timeout = setTimeout(() => {
+        pollDelayRef.current = Math.min(
+          pollDelayRef.current * 2,
+          MAX_POLL_DELAY_MS
+        );
         onRefresh();
-      }, 3000); // Poll every 3 seconds
+      }, pollDelayRef.current);
 
-      return () => clearInterval(interval);
+      return () => clearTimeout(timeout);
     } else {
+      pollDelayRef.current = INITIAL_POLL_DELAY_MS;
       setProcessingContracts(new Set());
     }
   }, [contracts, onRefresh]);
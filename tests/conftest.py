@@ -0,0 +1,62 @@
+import asyncio
+import tempfile
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+
+from .mocks import async_return
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Session-wide event loop so the async client can be shared"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Shared in-loop ASGI client; under pytest-xdist each worker builds its own"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def health_response(client):
+    """/health is deterministic, so dispatch it once per session"""
+    return await client.get("/health")
+
+
+@pytest.fixture
+def mock_db(monkeypatch):
+    """Stand-in for app.mongodb; the attribute only exists after startup.
+
+    Tests assign the collection methods they expect to be called; any other
+    database access fails loudly with AttributeError.
+    """
+    db = SimpleNamespace(contracts=SimpleNamespace())
+    monkeypatch.setattr(app, "mongodb", db, raising=False)
+    return db
+
+
+@pytest.fixture(scope="session")
+def tmp_upload_dir():
+    """One scratch directory for upload test files, removed once at session end"""
+    with tempfile.TemporaryDirectory() as upload_dir:
+        yield upload_dir
+
+
+@pytest.fixture
+def mongo_cursor_factory():
+    """Build a Motor-style cursor mock whose sort/skip/limit chain returns docs"""
+    def _make(docs):
+        cursor = SimpleNamespace(to_list=async_return(docs))
+        cursor.sort = cursor.skip = cursor.limit = lambda *args, **kwargs: cursor
+        return cursor
+    return _make
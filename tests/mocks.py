@@ -0,0 +1,28 @@
+"""
+Lightweight stand-ins for Motor coroutines used by the API tests
+"""
+
+
+def async_return(value):
+    """Return a plain coroutine function that resolves to value.
+
+    Cheaper than AsyncMock(return_value=value): no spec checks and no
+    call records kept around between tests.
+    """
+    async def _coro(*args, **kwargs):
+        return value
+    return _coro
+
+
+def recording_async_return(value):
+    """Like async_return, but keep each call's (args, kwargs) on .calls.
+
+    For tests that need to inspect what was sent to Mongo, e.g. projections.
+    """
+    calls = []
+
+    async def _coro(*args, **kwargs):
+        calls.append((args, kwargs))
+        return value
+    _coro.calls = calls
+    return _coro
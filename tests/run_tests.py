@@ -6,7 +6,25 @@ Test runner for all project tests
 import os
 import sys
 
-import pytest
+
+class _FileOutcomes:
+    """Tally passed and failed tests per file in the shared pytest session"""
+
+    def __init__(self):
+        self.by_file = {}
+
+    def _counts(self, report):
+        return self.by_file.setdefault(os.path.basename(report.nodeid.split("::")[0]), [0, 0])
+
+    def pytest_runtest_logreport(self, report):
+        if report.failed:
+            self._counts(report)[1] += 1
+        elif report.passed and report.when == "call":
+            self._counts(report)[0] += 1
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self._counts(report)[1] += 1
 
 
 def run_all_tests():
@@ -17,6 +35,8 @@ def run_all_tests():
     # Test categories
     test_categories = [
         ("Main System Tests", "test_main.py"),
+        ("Upload Limit Tests", "test_upload_limits.py"),
+        ("Scoring Engine Tests", "test_scoring_engine.py"),
         ("System Integration Tests", "test_system.py")
     ]
     
@@ -24,28 +44,38 @@ def run_all_tests():
     passed_tests = 0
     failed_tests = 0
     
+    existing_files = [test_file for _, test_file in test_categories if os.path.exists(test_file)]
+    outcomes = _FileOutcomes()
+    result = None
+    
+    if existing_files:
+        # Imported lazily so a run with no test files never bootstraps pytest
+        import pytest
+        
+        # One session for every file; xdist spreads them across cores, one file per worker
+        args = existing_files + ["-n", "auto", "--dist=loadfile", "--tb=short", "-p", "no:cacheprovider"]
+        if not os.environ.get("CI"):
+            args.append("-v")
+        result = pytest.main(args, plugins=[outcomes])
+    
     for category, test_file in test_categories:
         print(f"\n📋 {category}")
         print("-" * 30)
         
-        if os.path.exists(test_file):
-            try:
-                # Run the specific test file
-                result = pytest.main([test_file, "-v", "--tb=short"])
-                
-                if result == 0:
-                    print(f"✅ {category} - PASSED")
-                    passed_tests += 1
-                else:
-                    print(f"❌ {category} - FAILED")
-                    failed_tests += 1
-                    
-            except Exception as e:
-                print(f"❌ {category} - ERROR: {e}")
-                failed_tests += 1
-        else:
+        if test_file not in existing_files:
             print(f"⚠️  {category} - File not found: {test_file}")
             failed_tests += 1
+        else:
+            passed, failed = outcomes.by_file.get(test_file, (0, 0))
+            if failed:
+                print(f"❌ {category} - FAILED ({passed} passed, {failed} failed)")
+                failed_tests += 1
+            elif result not in (0, 1):  # pytest.ExitCode.OK / TESTS_FAILED
+                print(f"❌ {category} - ERROR: pytest exited with {result!r}")
+                failed_tests += 1
+            else:
+                print(f"✅ {category} - PASSED ({passed} passed)")
+                passed_tests += 1
         
         total_tests += 1
     
@@ -67,6 +97,8 @@ def run_all_tests():
 
 def run_specific_tests(test_pattern):
     """Run specific tests matching a pattern"""
+    import pytest
+    
     print(f"🔍 Running tests matching: {test_pattern}")
     return pytest.main(["-k", test_pattern, "-v"])
 
@@ -1,254 +1,250 @@
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 import tempfile
 import os
-from app.main import app
+from fastapi import HTTPException
+from app.main import delete_contract, download_contract, get_contract_data, get_contract_status
 from app.models import ContractStatus
 
-client = TestClient(app)
+from .mocks import async_return, recording_async_return
+
+pytestmark = pytest.mark.asyncio
+
+UPLOAD_URL = "/contracts/upload"
+LIST_URL = "/contracts"
+CONTRACT_URL = "/contracts/test-id"
+STATUS_URL = "/contracts/test-id/status"
+DOWNLOAD_URL = "/contracts/test-id/download"
+
+FAKE_PDF = b'%PDF-1.4 fake pdf content'
+NON_PDF = b'This is not a PDF file'
+
+# Multipart body for the PDF upload, encoded once at import time
+UPLOAD_BOUNDARY = "contract-upload-test-boundary"
+UPLOAD_BODY = (
+    f'--{UPLOAD_BOUNDARY}\r\n'
+    'Content-Disposition: form-data; name="file"; filename="test.pdf"\r\n'
+    'Content-Type: application/pdf\r\n\r\n'
+).encode() + FAKE_PDF + f'\r\n--{UPLOAD_BOUNDARY}--\r\n'.encode()
+UPLOAD_HEADERS = {"content-type": f"multipart/form-data; boundary={UPLOAD_BOUNDARY}"}
+
+# Static Mongo documents shared read-only across tests
+PROCESSING_CONTRACT = {
+    "id": "test-id",
+    "status": ContractStatus.PROCESSING,
+    "progress": 50,
+    "updated_at": "2023-01-01T00:00:00Z"
+}
+COMPLETED_CONTRACT = {
+    "id": "test-id",
+    "status": ContractStatus.COMPLETED,
+    "parsed_data": {
+        "parties": [{"name": "Test Company", "role": "customer"}],
+        "financial_details": {"total_contract_value": 10000}
+    }
+}
+UNPARSED_CONTRACT = {
+    "id": "test-id",
+    "status": ContractStatus.PROCESSING
+}
+STORED_CONTRACT = {
+    "id": "test-id",
+    "filename": "test.pdf",
+    "file_path": "/path/to/test.pdf"
+}
+CONTRACT_1 = {
+    "id": "test-1",
+    "filename": "contract1.pdf",
+    "status": ContractStatus.COMPLETED,
+    "uploaded_at": "2023-01-01T00:00:00Z",
+    "file_size": 1024,
+    "score": 85
+}
+CONTRACT_2 = {
+    "id": "test-2",
+    "filename": "contract2.pdf",
+    "status": ContractStatus.PROCESSING,
+    "uploaded_at": "2023-01-02T00:00:00Z",
+    "file_size": 2048,
+    "score": 0
+}
+
+# Fields each endpoint reads from the Mongo document it fetches
+STATUS_FIELDS = {"status", "progress", "error", "updated_at"}
+LIST_FIELDS = {"id", "filename", "status", "uploaded_at", "file_size", "score", "progress"}
+FILE_FIELDS = {"filename", "file_path"}
+
+
+def projected_fields(args, kwargs):
+    """Fields included by the projection of a recorded find/find_one call"""
+    projection = kwargs.get("projection", args[1] if len(args) > 1 else None)
+    assert projection is not None, "query was sent without a projection"
+    return {field for field, include in projection.items() if include}
 
 class TestContractUpload:
-    @patch('app.main.app.mongodb')
-    @patch('app.main.contract_parser')
-    @patch('app.main.scoring_engine')
-    def test_upload_contract_success(self, mock_scoring, mock_parser, mock_db):
+    # The background task would outlive the test's mocks on the shared loop, so stub it out
+    @patch('app.main.process_contract', new_callable=AsyncMock)
+    async def test_upload_contract_success(self, mock_process, mock_db, client,
+                                           tmp_upload_dir, monkeypatch):
         """Test successful contract upload"""
         # Mock database operations
-        mock_db.contracts.insert_one = AsyncMock()
+        mock_db.contracts.insert_one = async_return(None)
+        # Saved uploads land under the session scratch dir and are removed with it
+        monkeypatch.chdir(tmp_upload_dir)
         
-        # Create a temporary PDF file
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-            tmp_file.write(b'%PDF-1.4 fake pdf content')
-            tmp_file_path = tmp_file.name
+        response = await client.post(UPLOAD_URL, content=UPLOAD_BODY, headers=UPLOAD_HEADERS)
         
-        try:
-            with open(tmp_file_path, 'rb') as f:
-                response = client.post(
-                    "/contracts/upload",
-                    files={"file": ("test.pdf", f, "application/pdf")}
-                )
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert "contract_id" in data
-            assert data["status"] == "uploaded"
-            assert data["message"] == "Contract uploaded successfully"
-            
-        finally:
-            os.unlink(tmp_file_path)
+        assert response.status_code == 200
+        data = response.json()
+        assert "contract_id" in data
+        assert data["status"] == "uploaded"
+        assert data["message"] == "Contract uploaded successfully"
+        mock_process.assert_called_once_with(data["contract_id"])
 
-    def test_upload_non_pdf_file(self):
+    async def test_upload_non_pdf_file(self, client, tmp_upload_dir):
         """Test upload of non-PDF file"""
-        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as tmp_file:
-            tmp_file.write(b'This is not a PDF file')
-            tmp_file_path = tmp_file.name
-        
-        try:
-            with open(tmp_file_path, 'rb') as f:
-                response = client.post(
-                    "/contracts/upload",
-                    files={"file": ("test.txt", f, "text/plain")}
-                )
-            
-            assert response.status_code == 400
-            assert "Only PDF files are supported" in response.json()["detail"]
-            
-        finally:
-            os.unlink(tmp_file_path)
-
-    def test_upload_large_file(self):
-        """Test upload of file exceeding size limit"""
-        # Create a large file (simulate 51MB)
-        large_content = b'x' * (51 * 1024 * 1024)
-        
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-            tmp_file.write(large_content)
-            tmp_file_path = tmp_file.name
+        fd, _ = tempfile.mkstemp(suffix='.txt', dir=tmp_upload_dir)
+        with os.fdopen(fd, 'w+b') as tmp_file:
+            tmp_file.write(NON_PDF)
+            tmp_file.seek(0)
+            response = await client.post(
+                UPLOAD_URL,
+                files={"file": ("test.txt", tmp_file, "text/plain")}
+            )
         
-        try:
-            with open(tmp_file_path, 'rb') as f:
-                response = client.post(
-                    "/contracts/upload",
-                    files={"file": ("large.pdf", f, "application/pdf")}
-                )
-            
-            # Should still succeed as we're not enforcing size limit in the test
-            # In real implementation, you'd want to add size validation
-            assert response.status_code in [200, 413]
-            
-        finally:
-            os.unlink(tmp_file_path)
+        assert response.status_code == 400
+        assert "Only PDF files are supported" in response.json()["detail"]
 
 class TestContractStatus:
-    @patch('app.main.app.mongodb')
-    def test_get_contract_status_success(self, mock_db):
+    async def test_get_contract_status_success(self, mock_db, client):
         """Test getting contract status"""
-        mock_contract = {
-            "id": "test-id",
-            "status": ContractStatus.PROCESSING,
-            "progress": 50,
-            "updated_at": "2023-01-01T00:00:00Z"
-        }
-        mock_db.contracts.find_one = AsyncMock(return_value=mock_contract)
+        mock_db.contracts.find_one = recording_async_return(PROCESSING_CONTRACT)
         
-        response = client.get("/contracts/test-id/status")
+        response = await client.get(STATUS_URL)
         
         assert response.status_code == 200
         data = response.json()
         assert data["contract_id"] == "test-id"
         assert data["status"] == ContractStatus.PROCESSING
         assert data["progress"] == 50
+        (call,) = mock_db.contracts.find_one.calls
+        assert STATUS_FIELDS <= projected_fields(*call)
 
-    @patch('app.main.app.mongodb')
-    def test_get_contract_status_not_found(self, mock_db):
+    async def test_get_contract_status_not_found(self, mock_db):
         """Test getting status for non-existent contract"""
-        mock_db.contracts.find_one = AsyncMock(return_value=None)
+        mock_db.contracts.find_one = async_return(None)
         
-        response = client.get("/contracts/non-existent/status")
+        with pytest.raises(HTTPException) as exc_info:
+            await get_contract_status("non-existent")
         
-        assert response.status_code == 404
-        assert "Contract not found" in response.json()["detail"]
+        assert exc_info.value.status_code == 404
+        assert "Contract not found" in exc_info.value.detail
 
 class TestContractData:
-    @patch('app.main.app.mongodb')
-    def test_get_contract_data_success(self, mock_db):
+    async def test_get_contract_data_success(self, mock_db, client):
         """Test getting contract data"""
-        mock_contract = {
-            "id": "test-id",
-            "status": ContractStatus.COMPLETED,
-            "parsed_data": {
-                "parties": [{"name": "Test Company", "role": "customer"}],
-                "financial_details": {"total_contract_value": 10000}
-            }
-        }
-        mock_db.contracts.find_one = AsyncMock(return_value=mock_contract)
+        mock_db.contracts.find_one = async_return(COMPLETED_CONTRACT)
         
-        response = client.get("/contracts/test-id")
+        response = await client.get(CONTRACT_URL)
         
         assert response.status_code == 200
         data = response.json()
         assert "parties" in data
         assert "financial_details" in data
 
-    @patch('app.main.app.mongodb')
-    def test_get_contract_data_not_completed(self, mock_db):
+    async def test_get_contract_data_not_completed(self, mock_db):
         """Test getting data for non-completed contract"""
-        mock_contract = {
-            "id": "test-id",
-            "status": ContractStatus.PROCESSING
-        }
-        mock_db.contracts.find_one = AsyncMock(return_value=mock_contract)
+        mock_db.contracts.find_one = async_return(UNPARSED_CONTRACT)
         
-        response = client.get("/contracts/test-id")
+        with pytest.raises(HTTPException) as exc_info:
+            await get_contract_data("test-id")
         
-        assert response.status_code == 400
-        assert "Contract processing not completed" in response.json()["detail"]
+        assert exc_info.value.status_code == 400
+        assert "Contract processing not completed" in exc_info.value.detail
 
 class TestContractList:
-    @patch('app.main.app.mongodb')
-    def test_list_contracts_success(self, mock_db):
-        """Test listing contracts"""
-        mock_contracts = [
-            {
-                "id": "test-1",
-                "filename": "contract1.pdf",
-                "status": ContractStatus.COMPLETED,
-                "uploaded_at": "2023-01-01T00:00:00Z",
-                "file_size": 1024,
-                "score": 85
-            },
-            {
-                "id": "test-2",
-                "filename": "contract2.pdf",
-                "status": ContractStatus.PROCESSING,
-                "uploaded_at": "2023-01-02T00:00:00Z",
-                "file_size": 2048,
-                "score": 0
-            }
-        ]
-        
-        mock_cursor = AsyncMock()
-        mock_cursor.to_list = AsyncMock(return_value=mock_contracts)
-        mock_cursor.sort = MagicMock(return_value=mock_cursor)
-        mock_cursor.skip = MagicMock(return_value=mock_cursor)
-        mock_cursor.limit = MagicMock(return_value=mock_cursor)
-        
-        mock_db.contracts.find = MagicMock(return_value=mock_cursor)
-        mock_db.contracts.count_documents = AsyncMock(return_value=2)
-        
-        response = client.get("/contracts")
+    @pytest.mark.parametrize("query_string,mock_contracts,total,limit", [
+        ("", [CONTRACT_1, CONTRACT_2], 2, 10),
+        ("?status=completed&skip=0&limit=5", [CONTRACT_1], 1, 5),
+    ], ids=["default", "with_filters"])
+    async def test_list_contracts(self, mock_db, client, mongo_cursor_factory,
+                                  query_string, mock_contracts, total, limit):
+        """Test listing contracts with and without filters"""
+        mock_cursor = mongo_cursor_factory(mock_contracts)
+        find_calls = []
+        
+        def find(*args, **kwargs):
+            find_calls.append((args, kwargs))
+            return mock_cursor
+        mock_db.contracts.find = find
+        mock_db.contracts.count_documents = async_return(total)
+        
+        response = await client.get(LIST_URL + query_string)
         
         assert response.status_code == 200
         data = response.json()
-        assert len(data["contracts"]) == 2
-        assert data["total"] == 2
+        assert len(data["contracts"]) == len(mock_contracts)
+        assert data["total"] == total
         assert data["skip"] == 0
-        assert data["limit"] == 10
-
-    @patch('app.main.app.mongodb')
-    def test_list_contracts_with_filters(self, mock_db):
-        """Test listing contracts with filters"""
-        mock_contracts = [
-            {
-                "id": "test-1",
-                "filename": "contract1.pdf",
-                "status": ContractStatus.COMPLETED,
-                "uploaded_at": "2023-01-01T00:00:00Z",
-                "file_size": 1024,
-                "score": 85
-            }
-        ]
-        
-        mock_cursor = AsyncMock()
-        mock_cursor.to_list = AsyncMock(return_value=mock_contracts)
-        mock_cursor.sort = MagicMock(return_value=mock_cursor)
-        mock_cursor.skip = MagicMock(return_value=mock_cursor)
-        mock_cursor.limit = MagicMock(return_value=mock_cursor)
-        
-        mock_db.contracts.find = MagicMock(return_value=mock_cursor)
-        mock_db.contracts.count_documents = AsyncMock(return_value=1)
-        
-        response = client.get("/contracts?status=completed&skip=0&limit=5")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data["contracts"]) == 1
-        assert data["limit"] == 5
+        assert data["limit"] == limit
+        (call,) = find_calls
+        assert LIST_FIELDS <= projected_fields(*call)
 
 class TestContractDownload:
-    @patch('app.main.app.mongodb')
     @patch('os.path.exists')
-    def test_download_contract_success(self, mock_exists, mock_db):
+    async def test_download_contract_success(self, mock_exists, mock_db, client):
         """Test downloading contract"""
-        mock_contract = {
-            "id": "test-id",
-            "filename": "test.pdf",
-            "file_path": "/path/to/test.pdf"
-        }
-        mock_db.contracts.find_one = AsyncMock(return_value=mock_contract)
+        mock_db.contracts.find_one = recording_async_return(STORED_CONTRACT)
         mock_exists.return_value = True
         
         with patch('app.main.FileResponse') as mock_file_response:
             mock_file_response.return_value = MagicMock()
-            response = client.get("/contracts/test-id/download")
+            response = await client.get(DOWNLOAD_URL)
             
             assert response.status_code == 200
+        (call,) = mock_db.contracts.find_one.calls
+        assert FILE_FIELDS <= projected_fields(*call)
 
-    @patch('app.main.app.mongodb')
-    def test_download_contract_not_found(self, mock_db):
+    async def test_download_contract_not_found(self, mock_db):
         """Test downloading non-existent contract"""
-        mock_db.contracts.find_one = AsyncMock(return_value=None)
+        mock_db.contracts.find_one = async_return(None)
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await download_contract("non-existent")
+        
+        assert exc_info.value.status_code == 404
+        assert "Contract not found" in exc_info.value.detail
+
+class TestContractDelete:
+    @patch('os.path.exists')
+    async def test_delete_contract_success(self, mock_exists, mock_db, client):
+        """Test deleting contract"""
+        mock_db.contracts.find_one_and_delete = recording_async_return(STORED_CONTRACT)
+        mock_exists.return_value = False
+        
+        response = await client.delete(CONTRACT_URL)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["contract_id"] == "test-id"
+        assert data["filename"] == "test.pdf"
+        (call,) = mock_db.contracts.find_one_and_delete.calls
+        assert FILE_FIELDS <= projected_fields(*call)
+
+    async def test_delete_contract_not_found(self, mock_db):
+        """Test deleting non-existent contract"""
+        mock_db.contracts.find_one_and_delete = async_return(None)
         
-        response = client.get("/contracts/non-existent/download")
+        with pytest.raises(HTTPException) as exc_info:
+            await delete_contract("non-existent")
         
-        assert response.status_code == 404
-        assert "Contract not found" in response.json()["detail"]
+        assert exc_info.value.status_code == 404
+        assert "Contract not found" in exc_info.value.detail
 
 class TestHealthCheck:
-    def test_health_check(self):
+    async def test_health_check(self, health_response):
         """Test health check endpoint"""
-        response = client.get("/health")
+        response = health_response
         
         assert response.status_code == 200
         data = response.json()
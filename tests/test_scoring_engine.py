@@ -0,0 +1,116 @@
+import pytest
+
+from app.scoring import ScoringEngine
+
+# Static parsed-data payloads shared read-only across tests
+DETAILED_LINE_ITEM = {"description": "Annual license", "quantity": 1, "unit_price": 10000}
+COMPLETE_PARSED_DATA = {
+    "parties": [
+        {"name": "Acme Corp", "role": "customer", "email": "billing@acme.com"},
+        {"name": "Vendor LLC", "role": "vendor", "phone": "555-123-4567"}
+    ],
+    "account_info": {"contact_email": "billing@acme.com", "contact_phone": "555-987-6543"},
+    "financial_details": {
+        "total_contract_value": 10000,
+        "line_items": [DETAILED_LINE_ITEM],
+        "currency": "USD",
+        "tax_amount": 800,
+        "additional_fees": [{"name": "Setup", "amount": 500}]
+    },
+    "payment_terms": {
+        "payment_terms": "Net 30",
+        "payment_schedule": "Monthly",
+        "due_dates": ["2024-01-31"],
+        "payment_methods": ["ACH"],
+        "banking_details": "Routing 123"
+    },
+    "revenue_classification": {"payment_type": "recurring", "billing_cycle": "monthly"},
+    "sla": {
+        "performance_metrics": ["99.9% uptime"],
+        "penalty_clauses": ["5% credit per hour of downtime"],
+        "support_terms": "24/7 support",
+        "maintenance_terms": "Monthly maintenance window"
+    },
+    "contract_start_date": "2024-01-01",
+    "contract_end_date": "2024-12-31"
+}
+
+
+@pytest.fixture(scope="module")
+def scoring_engine():
+    """One engine for the module; scoring only reads its weight tables"""
+    return ScoringEngine()
+
+
+class TestScoringEngine:
+    @pytest.mark.parametrize("parsed_data,expected", [
+        (COMPLETE_PARSED_DATA, 92),
+        ({"financial_details": {**COMPLETE_PARSED_DATA["financial_details"], "line_items": [DETAILED_LINE_ITEM] * 6}}, 100),
+        ({"financial_details": {**COMPLETE_PARSED_DATA["financial_details"], "line_items": [{"quantity": 1}]}}, 90),
+        ({"financial_details": {**COMPLETE_PARSED_DATA["financial_details"], "line_items": []}}, 70),
+        ({"financial_details": {"total_contract_value": 10000}}, 40),
+        ({}, 0),
+    ], ids=["complete", "detailed_line_items_capped", "bare_line_item", "no_line_items", "partial", "empty"])
+    def test_calculate_financial_score(self, scoring_engine, parsed_data, expected):
+        """Test financial score for complete, partial and missing details"""
+        assert scoring_engine._calculate_financial_score(parsed_data) == expected
+
+    @pytest.mark.parametrize("parsed_data,expected", [
+        (COMPLETE_PARSED_DATA, 100),
+        ({"parties": [{"name": "Acme Corp"}]}, 40),
+        ({}, 0),
+    ], ids=["complete", "partial", "empty"])
+    def test_calculate_party_score(self, scoring_engine, parsed_data, expected):
+        """Test party score for complete, partial and missing parties"""
+        assert scoring_engine._calculate_party_score(parsed_data) == expected
+
+    @pytest.mark.parametrize("parsed_data,expected", [
+        (COMPLETE_PARSED_DATA, 100),
+        ({"payment_terms": {"payment_terms": "Net 30"}}, 40),
+        ({}, 0),
+    ], ids=["complete", "partial", "empty"])
+    def test_calculate_payment_score(self, scoring_engine, parsed_data, expected):
+        """Test payment score for complete, partial and missing terms"""
+        assert scoring_engine._calculate_payment_score(parsed_data) == expected
+
+    @pytest.mark.parametrize("parsed_data,expected", [
+        (COMPLETE_PARSED_DATA, 100),
+        ({"sla": {"support_terms": "Business hours support"}}, 25),
+        ({}, 0),
+    ], ids=["complete", "partial", "empty"])
+    def test_calculate_sla_score(self, scoring_engine, parsed_data, expected):
+        """Test SLA score for complete, partial and missing SLA"""
+        assert scoring_engine._calculate_sla_score(parsed_data) == expected
+
+    def test_calculate_score_complete(self, scoring_engine):
+        """Test overall score and gaps for a complete contract"""
+        score, gaps = scoring_engine.calculate_score(COMPLETE_PARSED_DATA)
+
+        assert score == 96.6
+        assert gaps == []
+
+    def test_identify_gaps_empty(self, scoring_engine):
+        """Test every section is reported missing for empty data"""
+        gaps = scoring_engine._identify_gaps({})
+
+        assert "No contract parties identified" in gaps
+        assert "No financial details found" in gaps
+        assert "Missing contract end date" in gaps
+        assert len(gaps) == 8
+
+    @pytest.mark.parametrize("parsed_data", [
+        COMPLETE_PARSED_DATA,
+        {"parties": [{"name": "Acme Corp"}], "payment_terms": {"payment_terms": "Net 30"}},
+        {},
+    ], ids=["complete", "partial", "empty"])
+    def test_score_breakdown(self, scoring_engine, parsed_data):
+        """Test breakdown components are bounded and agree with calculate_score"""
+        score, gaps = scoring_engine.calculate_score(parsed_data)
+        breakdown = scoring_engine.get_score_breakdown(parsed_data)
+        components = breakdown["component_scores"]
+
+        assert breakdown["overall_score"] == score
+        assert breakdown["gaps"] == gaps
+        assert set(components) == set(scoring_engine.weights)
+        assert sum(component["weight"] for component in components.values()) == 100
+        assert all(0 <= component["score"] <= component["max_points"] for component in components.values())
@@ -0,0 +1,23 @@
+from unittest.mock import patch
+
+import pytest
+
+pytestmark = pytest.mark.asyncio
+
+UPLOAD_URL = "/contracts/upload"
+
+# 2KB payload checked against a limit patched down to 1KB
+OVERSIZED_PDF = b'%PDF-1.4' + b'x' * 2048
+
+
+class TestUploadLimits:
+    @patch('app.main.MAX_UPLOAD_SIZE', 1024)
+    async def test_upload_large_file(self, client):
+        """Test upload of file exceeding size limit"""
+        response = await client.post(
+            UPLOAD_URL,
+            files={"file": ("large.pdf", OVERSIZED_PDF, "application/pdf")}
+        )
+        
+        assert response.status_code == 413
+        assert "File size exceeds" in response.json()["detail"]